@@ -1,9 +1,31 @@
 import logging
-import re
-from typing import Optional
+import string
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
-import openai  # version 1.5
-import tiktoken
+# openai and tiktoken take most of a second to import, they are only loaded
+# once a client or encoder is actually needed
+if TYPE_CHECKING:
+    import openai  # version 1.5
+    import tiktoken
+
+# Characters allowed in an API key after the "sk-" prefix
+_API_KEY_CHARS = frozenset(string.ascii_letters + string.digits + "_-")
+
+
+@lru_cache(maxsize=None)
+def _get_encoder(model: str) -> "tiktoken.Encoding":
+    """
+    Returns the tiktoken encoder for a model, loading it only once.
+
+    Models unknown to tiktoken fall back to the cl100k_base encoding.
+    """
+    import tiktoken
+
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
 
 
 class GPT:
@@ -41,10 +63,19 @@ class GPT:
             "output": 6.00 / 1_000_000,  # $6.00 per 1M output tokens
         },
     }
+    # Prompt tokens served from OpenAI's prompt cache are billed at half the
+    # input rate
+    CACHED_INPUT_FACTOR = 0.5
 
     def __init__(self) -> None:
         self._api_key: Optional[str] = None
-        self.api_key_regex = r"^sk-[A-Za-z0-9_-]{48,}$"  # Updated regex
+        # Client bound to the current API key. It keeps its own connection
+        # pool, so consecutive requests reuse the same TLS connection.
+        self._client: Optional["openai.OpenAI"] = None
+        # Token counts of system messages, keyed by (model, system message).
+        # The system prompt is the same for every summary, so it only needs
+        # to be tokenized once.
+        self._system_tokens: Dict[Tuple[str, str], int] = {}
 
     @property
     def api_key(self) -> str | None:
@@ -70,11 +101,17 @@ class GPT:
         if not key:
             raise ValueError("API key cannot be empty")
 
-        if not re.match(self.api_key_regex, key):
+        if not (
+            key.startswith("sk-")
+            and len(key) >= 51
+            and _API_KEY_CHARS.issuperset(key[3:])
+        ):
             raise ValueError("API key is invalid")
 
         self._api_key = key
-        openai.api_key = key
+        import openai
+
+        self._client = openai.OpenAI(api_key=key)
 
     def count_tokens(self, text: str, model: str = "gpt-4o-mini") -> int:
         """
@@ -87,13 +124,65 @@ class GPT:
         Returns:
             int: The number of tokens.
         """
+        if not text:
+            return 0
         try:
-            encoder = tiktoken.encoding_for_model(model)
-            return len(encoder.encode(text))
+            return len(_get_encoder(model).encode(text))
         except Exception as e:
-            logging.error(f"Error counting tokens for model {model}: {e}")
+            logging.error("Error counting tokens for model %s: %s", model, e)
             return 0
 
+    def count_tokens_batch(
+        self, texts: List[str], model: str = "gpt-4o-mini"
+    ) -> List[int]:
+        """
+        Counts the number of tokens of several texts with one encoder lookup.
+
+        Args:
+            texts (List[str]): The texts to tokenize.
+            model (str): The model name.
+
+        Returns:
+            List[int]: The number of tokens of each text.
+        """
+        if not any(texts):
+            return [0] * len(texts)
+        try:
+            # encode_batch starts a thread pool per call, which costs more than
+            # it saves for the few short texts counted here
+            encoder = _get_encoder(model)
+            return [len(encoder.encode(text)) if text else 0 for text in texts]
+        except Exception as e:
+            logging.error("Error counting tokens for model %s: %s", model, e)
+            return [0] * len(texts)
+
+    def _count_completion_tokens(
+        self,
+        model: str,
+        system_message: str,
+        user_message: str,
+        output_text: str,
+    ) -> Tuple[int, int]:
+        """
+        Counts the input and output tokens of a completion locally.
+
+        Returns:
+            Tuple[int, int]: The input and output token counts.
+        """
+        # Count with one encoder lookup, the system message only has to be
+        # counted the first time it is used
+        system_key = (model, system_message)
+        system_tokens = self._system_tokens.get(system_key)
+        texts = [user_message, output_text]
+        if system_tokens is None:
+            texts.append(system_message)
+        counts = self.count_tokens_batch(texts, model=model)
+        if system_tokens is None:
+            system_tokens = counts[2]
+            if system_tokens:
+                self._system_tokens[system_key] = system_tokens
+        return system_tokens + counts[0], counts[1]
+
     def chat_completion(
         self, model: str, system_message: str, user_message: str
     ) -> str:
@@ -111,44 +200,67 @@ class GPT:
         """
         logging.info("Requesting chat completion from OpenAI")
 
-        if model not in self.PRICING:
+        pricing = self.PRICING.get(model)
+        if pricing is None:
             logging.error(f"Model {model} not found in pricing information.")
             return ""
 
+        if self._client is None:
+            logging.error("API key must be set before requesting a completion")
+            return ""
+
         messages = [
             {"role": "system", "content": system_message},
             {"role": "user", "content": user_message},
         ]
 
-        # Count input tokens
-        input_tokens = sum(
-            self.count_tokens(message["content"], model=model)
-            for message in messages
-        )
-
         try:
-            response = openai.chat.completions.create(
+            response = self._client.chat.completions.create(
                 model=model,
                 messages=messages,
             )
 
             output_text = (
-                response.choices[0].message.content if response.choices else ""
+                (response.choices[0].message.content or "")
+                if response.choices
+                else ""
             )
-            output_tokens = self.count_tokens(output_text, model=model)
+
+            # The cost summary is only logged at INFO, skip counting and
+            # formatting it when nobody would see it
+            if not logging.getLogger().isEnabledFor(logging.INFO):
+                return output_text
+
+            # The API already reports the billed token counts, only count
+            # locally when the endpoint leaves the usage out
+            usage = getattr(response, "usage", None)
+            cached_tokens = 0
+            if usage is not None:
+                input_tokens = usage.prompt_tokens
+                output_tokens = usage.completion_tokens
+                details = getattr(usage, "prompt_tokens_details", None)
+                cached_tokens = getattr(details, "cached_tokens", None) or 0
+            else:
+                input_tokens, output_tokens = self._count_completion_tokens(
+                    model, system_message, user_message, output_text
+                )
 
             # Calculate costs
-            input_cost = input_tokens * self.PRICING[model]["input"]
-            output_cost = output_tokens * self.PRICING[model]["output"]
-            total_cost = input_cost + output_cost
+            input_rate = pricing["input"]
+            uncached_cost = (input_tokens - cached_tokens) * input_rate
+            cached_cost = cached_tokens * input_rate * self.CACHED_INPUT_FACTOR
+            output_cost = output_tokens * pricing["output"]
+            total_cost = uncached_cost + cached_cost + output_cost
 
             # Log the costs
             logging.info(
                 f"\n{'-'*40}\n"
                 f"{'Model':<15}: {model}\n"
                 f"{'Input Tokens':<15}: {input_tokens}\n"
+                f"{'Cached Tokens':<15}: {cached_tokens}\n"
                 f"{'Output Tokens':<15}: {output_tokens}\n"
-                f"{'Input Cost':<15}: ${input_cost:.6f}\n"
+                f"{'Uncached Cost':<15}: ${uncached_cost:.6f}\n"
+                f"{'Cached Cost':<15}: ${cached_cost:.6f}\n"
                 f"{'Output Cost':<15}: ${output_cost:.6f}\n"
                 f"{'Total Cost':<15}: ${total_cost:.6f}\n"
                 f"{'-'*40}"
@@ -158,162 +270,3 @@ class GPT:
         except Exception as e:
             logging.error(f"An error occurred during chat completion: {e}")
             return ""
-
-    ### Deprecated method, not planning to use it in the future ## noqa: E266
-
-    # def assistant(self, prompt: str, thread_id: Optional[str] = None) -> str:
-    #     """
-    #     Assistant endpoint for OpenAI API.
-
-    #     It creates for each message/summary a different thread to keep the cost low,
-    #     also notifications don't need to be appended, as they have different context.
-    #     The greater the context, the greater the cost.
-
-    #     Args:
-    #         prompt (str): The prompt message for the assistant.
-    #         thread_id (str): The ID of the thread to use. If None, a new thread will be created.
-
-    #     Returns:
-    #         str: The response message from the assistant.
-    #     """
-    #     logging.info("Requesting assistant from OpenAI")
-    #     return self.assistant(prompt, thread_id)
-
-    # def context_assistant(self, prompt: str) -> str:
-    #     """
-    #     Generates a response using the assistant endpoint of OpenAI API with saved context.
-
-    #     Args:
-    #         prompt (str): The prompt message for the assistant.
-
-    #     Returns:
-    #         str: The response message from the assistant.
-    #     """
-    #     thread_id = self.resume_thread()
-    #     return self.assistant(prompt, thread_id)
-
-    # def run_assistant(self, text, thread_id):
-    #     """
-    #     Runs the assistant to generate a response.
-
-    #     Args:
-    #         text (str): The text message for the assistant.
-    #         thread_id (str): The ID of the thread to use.
-
-    #     Returns:
-    #         str: The response message from the assistant.
-    #     """
-    #     try:
-    #         if thread_id is None:
-    #             thread_id = openai.beta.threads.create().id
-
-    #         assistant_id = (
-    #             "asst_Zvg2CnDYdcv3l9BcbtyURZIN"  # --> Moodle-Mate assistant
-    #         )
-    #         message = openai.beta.threads.messages.create(
-    #             thread_id=thread_id,
-    #             role="user",
-    #             content=text,
-    #         )
-    #         run = openai.beta.threads.runs.create(
-    #             thread_id=thread_id, assistant_id=assistant_id
-    #         )
-
-    #         result = openai.beta.threads.runs.retrieve(
-    #             thread_id=thread_id, run_id=run.id
-    #         )
-
-    #         delay = 0.5
-    #         while result.status != "completed":
-    #             result = openai.beta.threads.runs.retrieve(
-    #                 thread_id=thread_id, run_id=run.id
-    #             )
-    #             sleep(delay)
-    #             delay += 0.5
-    #             delay = min(delay, 10)
-
-    #         logging.info(f"Status: {result.status}")
-
-    #         messages = openai.beta.threads.messages.list(thread_id=thread_id)
-    #         return next(
-    #             (
-    #                 message.content[0].text.value
-    #                 for message in messages.data
-    #                 if message.role == "assistant"
-    #             ),
-    #             None,
-    #         )
-    #     except Exception as e:
-    #         logging.error(f"An error occurred during assistant run: {e}")
-    #         return ""
-
-    # def create_thread(self) -> str:
-    #     """
-    #     Creates a new thread for the assistant.
-
-    #     Returns:
-    #         str: The thread ID.
-    #     """
-    #     try:
-    #         return openai.beta.threads.create().id
-    #     except Exception as e:
-    #         logging.error(f"An error occurred while creating a new thread: {e}")
-    #         return ""
-
-    # def save_thread(self, thread_id: str) -> None:
-    #     """
-    #     Saves the thread ID to a config file for resuming the conversation later.
-
-    #     Args:
-    #         thread_id (str): The thread ID to save.
-    #     """
-    #     self.save_or_update_thread(thread_id, "Thread saved")
-
-    # def update_thread(self, thread_id: str) -> None:
-    #     """
-    #     Updates the thread ID in the config file with a fresh one (clears the conversation).
-
-    #     Args:
-    #         thread_id (str): The thread ID to update.
-    #     """
-    #     self.save_or_update_thread(thread_id, "Thread updated")
-
-    # def save_or_update_thread(self, thread_id: str, message: str) -> None:
-    #     """
-    #     Saves or updates the thread ID in the config file.
-
-    #     Args:
-    #         thread_id (str): The thread ID to save or update.
-    #         message (str): The message to log after saving or updating the thread.
-    #     """
-    #     try:
-    #         config = configparser.ConfigParser()
-    #         config.read("thread.ini")
-    #         config["THREAD"] = {"thread_id": thread_id}
-    #         with open("thread.ini", "w") as configfile:
-    #             config.write(configfile)
-    #             logging.info(message)
-    #     except Exception as e:
-    #         logging.error(
-    #             f"An error occurred while saving/updating the thread: {e}"
-    #         )
-
-    # def resume_thread(self) -> str:
-    #     """
-    #     Resumes the thread from the config file or creates a new thread if not found.
-
-    #     Returns:
-    #         str: The thread ID.
-    #     """
-    #     try:
-    #         config = configparser.ConfigParser()
-    #         config.read("thread.ini")
-    #         if "THREAD" not in config or "thread_id" not in config["THREAD"]:
-    #             thread_id = self.create_thread()
-    #             self.save_thread(thread_id)
-    #         else:
-    #             thread_id = config["THREAD"]["thread_id"]
-    #         return thread_id
-    #     except Exception as e:
-    #         logging.error(f"An error occurred while resuming the thread: {e}")
-    #         return self.create_thread()
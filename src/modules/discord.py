@@ -20,12 +20,30 @@ Date: 30.11.2023
 Github: @EvickaStudio
 """
 
-import datetime
 import logging
 import random
+import time
 
 import requests
 
+from src.utils import REQUEST_TIMEOUT, session
+
+LOGO_URL = "https://raw.githubusercontent.com/EvickaStudio/Moodle-Mate/main/assets/logo.png"
+
+# Discord webhook limits, longer values are rejected with HTTP 400
+TITLE_LIMIT = 256
+DESCRIPTION_LIMIT = 4096
+FIELD_VALUE_LIMIT = 1024
+AUTHOR_NAME_LIMIT = 256
+CONTENT_LIMIT = 2000
+
+
+def _cap(text: str, limit: int) -> str:
+    """
+    Truncates text to the given limit, without copying short strings.
+    """
+    return text if len(text) <= limit else text[:limit]
+
 
 class Discord:
     """
@@ -36,35 +54,24 @@ class Discord:
 
     Methods:
 
-        random_color() -> str:
-            Generate a random hex color code to use for embeds.
-
         __call__(...) -> bool:
             Send a notification to the configured webhook URL. Supports
             both rich embed and simple text message formats.
 
     """
 
-    """
-    Class representing a Discord webhook client.
-
-    Methods:
-        random_color() -> str: Generate a random color.
-        __call__(...) -> bool: Send a notification to Discord.
-    """
-
     def __init__(self, webhook_url: str, bot_name: str, thumbnail: str) -> None:
         self.webhook_url = webhook_url
         self.bot_name = bot_name
         self.thumbnail = thumbnail
-
-    @staticmethod
-    def random_color() -> str:
-        return "#{:02x}{:02x}{:02x}".format(
-            random.randint(0, 255),
-            random.randint(0, 255),
-            random.randint(0, 255),
-        )
+        # Shared session, keeps the connection to Discord alive
+        self.session = session
+        # Static parts of every embed payload, built once
+        self._payload_template = {
+            "username": self.bot_name,
+            "avatar_url": LOGO_URL,
+        }
+        self._thumbnail = {"url": self.thumbnail}
 
     def __call__(
         self,
@@ -80,48 +87,51 @@ class Discord:
             if not embed:
                 return self.send_simple(subject, text)
 
-            current_time = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            current_time = time.strftime("%Y-%m-%d %H:%M:%S")
             embed_json: dict = {
-                "title": subject,
-                "description": text,
-                "color": int(self.random_color()[1:], 16),
-                "fields": [],
-                "author": {},
-                "footer": {},
-                "thumbnail": {"url": self.thumbnail},
+                "title": _cap(subject, TITLE_LIMIT),
+                "description": _cap(text, DESCRIPTION_LIMIT),
+                # Embeds take the colour as an integer, no need for a hex string
+                "color": random.getrandbits(24),
+                "footer": {
+                    "text": f"{current_time} - Moodle-Mate",
+                    "icon_url": LOGO_URL,
+                },
+                "thumbnail": self._thumbnail,
             }
 
+            # Optional parts are only added when present
             if summary:
-                embed_json["fields"].append({"name": "TL;DR", "value": summary})
+                embed_json["fields"] = [
+                    {"name": "TL;DR", "value": _cap(summary, FIELD_VALUE_LIMIT)}
+                ]
 
             if fullname and picture_url:
-                embed_json["author"]["name"] = fullname
-                embed_json["author"]["icon_url"] = picture_url
-
-            embed_json["footer"]["text"] = f"{current_time} - Moodle-Mate"
-            embed_json["footer"][
-                "icon_url"
-            ] = "https://raw.githubusercontent.com/EvickaStudio/Moodle-Mate/main/assets/logo.png"
-
-            payload = {
-                "embeds": [embed_json],
-                "username": self.bot_name,
-                "avatar_url": "https://raw.githubusercontent.com/EvickaStudio/Moodle-Mate/main/assets/logo.png",
-            }
-            response = requests.post(self.webhook_url, json=payload)
+                embed_json["author"] = {
+                    "name": _cap(fullname, AUTHOR_NAME_LIMIT),
+                    "icon_url": picture_url,
+                }
+
+            payload = {**self._payload_template, "embeds": [embed_json]}
+            response = self.session.post(
+                self.webhook_url, json=payload, timeout=REQUEST_TIMEOUT
+            )
             response.raise_for_status()
 
             return True
         except requests.exceptions.RequestException as e:
-            logging.error(f"Error sending Discord notification: {e}")
+            logging.error("Error sending Discord notification: %s", e)
             return False
 
     def send_simple(self, subject: str, text: str) -> bool:
         try:
-            payload = {"content": f"<strong>{subject}</strong>\n{text}"}
-            response = requests.post(self.webhook_url, json=payload)
+            content = f"<strong>{subject}</strong>\n{text}"
+            payload = {"content": _cap(content, CONTENT_LIMIT)}
+            response = self.session.post(
+                self.webhook_url, json=payload, timeout=REQUEST_TIMEOUT
+            )
             response.raise_for_status()
             return True
         except requests.exceptions.RequestException as e:
-            logging.error(f"Error sending Discord notification: {e}")
+            logging.error("Error sending Discord notification: %s", e)
             return False
@@ -18,6 +18,8 @@ import logging
 
 import requests
 
+from src.utils import REQUEST_TIMEOUT, session
+
 
 class Gotify:
     """Gotify notification module."""
@@ -26,6 +28,9 @@ class Gotify:
         """Initialize with Gotify instance URL and token."""
         self.url = url
         self.token = token
+        self.session = session
+        self.headers = {"X-Gotify-Key": self.token}
+        self.message_url = f"{url.rstrip('/')}/message"
 
     def send_notification(self, title: str, message: str) -> bool:
         """Send a notification to Gotify.
@@ -34,12 +39,14 @@ class Gotify:
         Returns True if the notification was sent successfully, False otherwise.
         """
         """Send notification to Gotify."""
-        headers = {"X-Gotify-Key": self.token}
         data = {"title": title, "message": message}
 
         try:
-            response = requests.post(
-                f"{self.url}/message", headers=headers, json=data
+            response = self.session.post(
+                self.message_url,
+                headers=self.headers,
+                json=data,
+                timeout=REQUEST_TIMEOUT,
             )
             if response.status_code == 200:
                 logging.info("Notification sent to Gotify")
@@ -20,6 +20,8 @@ import logging
 
 import requests
 
+from src.utils import REQUEST_TIMEOUT, session
+
 
 class Ntfy:
     """
@@ -42,6 +44,7 @@ class Ntfy:
         """
         self.server_url = None
         self.topic = None
+        self.session = session
 
     def send_notification(
         self, topic, title, message, priority="urgent"
@@ -62,9 +65,11 @@ class Ntfy:
             "Tags": "email",
         }
         try:
-            response = requests.post(url, data=message, headers=headers)
+            response = self.session.post(
+                url, data=message, headers=headers, timeout=REQUEST_TIMEOUT
+            )
             response.raise_for_status()  # Raise an exception if the request was not successful
             return True
         except requests.exceptions.RequestException as e:
-            logging.error(f"Error sending ntfy notification: {e}")
+            logging.error("Error sending ntfy notification: %s", e)
             return False
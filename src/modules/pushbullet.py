@@ -24,6 +24,8 @@ import logging
 
 import requests
 
+from src.utils import REQUEST_TIMEOUT, session
+
 
 class Pushbullet:
     def __init__(self, api_key: str):
@@ -38,6 +40,8 @@ class Pushbullet:
         """
         self.api_key = api_key
         self.url = "https://api.pushbullet.com/v2/pushes"
+        self.session = session
+        self.headers = {"Access-Token": self.api_key}
 
     def send_notification(self, title: str, body: str) -> bool:
         """
@@ -50,16 +54,25 @@ class Pushbullet:
         Returns:
             bool: True if the push notification was sent successfully, False otherwise.
         """
-        headers = {"Access-Token": self.api_key}
         data = {"type": "note", "title": title, "body": body}
         try:
-            response = requests.post(
-                url=self.url, headers=headers, json=data, timeout=5
+            response = self.session.post(
+                url=self.url,
+                headers=self.headers,
+                json=data,
+                timeout=REQUEST_TIMEOUT,
             )
             response.raise_for_status()
             return True
         except requests.exceptions.RequestException as e:
-            logging.error(
-                f"Error sending pushbullet notification: {e}. Response status code: {response.status_code}, response text: {response.text}"  # noqa: E501
-            )
+            # e.response is None when the request never got a response
+            if e.response is None:
+                logging.error("Error sending pushbullet notification: %s", e)
+            else:
+                logging.error(
+                    "Error sending pushbullet notification: %s. Response status code: %s, response text: %s",  # noqa: E501
+                    e,
+                    e.response.status_code,
+                    e.response.text,
+                )
             return False
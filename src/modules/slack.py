@@ -17,7 +17,7 @@
 
 import logging
 
-import requests
+from src.utils import REQUEST_TIMEOUT, session
 
 
 class Slack:
@@ -28,6 +28,7 @@ class Slack:
 
     def __init__(self, webhook_url) -> None:
         self.webhook_url = webhook_url
+        self.session = session
 
     def send_notification(self, subject: str, text: str) -> bool:
         """
@@ -44,14 +45,16 @@ class Slack:
         """
         payload = {"text": f"*{subject}*\n{text}"}
         try:
-            response = requests.post(self.webhook_url, json=payload)
+            response = self.session.post(
+                self.webhook_url, json=payload, timeout=REQUEST_TIMEOUT
+            )
             if response.status_code != 200:
                 raise ValueError(
                     f"Request to slack returned an error {response.status_code}, the response is:\n{response.text}"
                 )
             return True
         except Exception as e:
-            logging.error(f"Error sending notification to Slack: {e}")
+            logging.error("Error sending notification to Slack: %s", e)
             return False
 
 
@@ -4,6 +4,11 @@ import time
 
 from src.filters import convert
 
+logger = logging.getLogger(__name__)
+
+# Upper bound for the wait between retries after consecutive errors
+MAX_RETRY_DELAY = 300
+
 
 class NotificationProcessor:
     def __init__(
@@ -19,29 +24,29 @@ class NotificationProcessor:
         self.summarizer = summarizer
         self.sender = sender
         self.summary_setting = summary_setting
+        self._summarize_enabled = summary_setting == 1
         self.sleep_duration = sleep_duration
         self.max_retries = max_retries
 
     def run(self):
         retry_count = 0
         while True:
+            started = time.monotonic()
             try:
                 if notification := self.handler.fetch_newest_notification():
                     if text := convert(notification["fullmessagehtml"]):
+                        logger.debug(
+                            "Original text: %s", notification["fullmessagehtml"]
+                        )
+                        logger.debug("Converted text: %s", text)
 
-                        # Debug, to see notification content uncomment the line below
-                        # logging.info(
-                        #     f"Original text: {notification['fullmessagehtml']}"
-                        # )
-                        # logging.info(f"Converted text: {text}")
-
-                        if self.summary_setting == 1:
-                            logging.info("Summarizing text...")
-                            summary = self.summarizer.summarize(
-                                notification["fullmessagehtml"]
-                            )
+                        if self._summarize_enabled:
+                            logger.info("Summarizing text...")
+                            # Summarize the converted markdown, the raw HTML
+                            # only adds markup tokens to the request.
+                            summary = self.summarizer.summarize(text)
                         else:
-                            logging.info("Summary is disabled.")
+                            logger.info("Summary is disabled.")
                             summary = ""
 
                         self.sender.send(
@@ -51,21 +56,32 @@ class NotificationProcessor:
                             notification["useridfrom"],
                         )
                 retry_count = 0  # Reset retry count if successful
-                time.sleep(self.sleep_duration)
+                # Poll on a fixed cadence: the time spent fetching, summarizing
+                # and sending counts towards the interval.
+                elapsed = time.monotonic() - started
+                time.sleep(max(0.0, self.sleep_duration - elapsed))
             except KeyboardInterrupt:
-                logging.info("Exiting main loop")
+                logger.info("Exiting main loop")
                 break
             except Exception:
-                logging.exception("An error occurred in the main loop")
+                logger.exception("An error occurred in the main loop")
                 retry_count += 1
                 if retry_count > self.max_retries:
                     # error_message = f"An error occurred in the main loop:\n\n{traceback.format_exc()}"
                     # Optionally, send the error message via Discord
                     # self.sender.send_simple("Error", error_message)
-                    logging.error("Max retries reached. Exiting main loop.")
+                    logger.error("Max retries reached. Exiting main loop.")
                     sys.exit(1)
                 else:
-                    logging.warning(
-                        f"Retrying ({retry_count}/{self.max_retries})..."
+                    # Back off exponentially while errors persist
+                    retry_delay = max(
+                        self.sleep_duration,
+                        min(
+                            self.sleep_duration * 2 ** (retry_count - 1),
+                            MAX_RETRY_DELAY,
+                        ),
+                    )
+                    logger.warning(
+                        "Retrying (%d/%d)...", retry_count, self.max_retries
                     )
-                    time.sleep(self.sleep_duration)
+                    time.sleep(retry_delay)
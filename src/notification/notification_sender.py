@@ -1,5 +1,6 @@
 import logging
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Tuple
 
 from src.modules import Discord, Pushbullet
 from src.moodle import MoodleNotificationHandler
@@ -34,8 +35,22 @@ class NotificationSender:
         self.webhook_discord = Discord(
             self.webhook_url, self.bot_name, self.thumbnail
         )
+        self.pushbullet = Pushbullet(self.pushbullet_key)
         self.moodle_handler = MoodleNotificationHandler(config)
 
+        # Enabled providers, resolved once. Every entry takes the same
+        # arguments, so send() does not need to know which ones are active.
+        self.senders: List[Tuple[str, Callable[..., None]]] = []
+        if self.pushbullet_state == 1:
+            self.senders.append(("Pushbullet", self._send_pushbullet))
+        if self.webhook_state == 1:
+            self.senders.append(("Discord", self._send_discord))
+
+        self.executor = ThreadPoolExecutor(
+            max_workers=max(len(self.senders), 1),
+            thread_name_prefix="notification-sender",
+        )
+
     # userifrom defauls to null, if you want to use your own user id, use the parameter useridfrom
     @handle_exceptions
     def send(
@@ -54,46 +69,59 @@ class NotificationSender:
             summary (str): A summary of the notification.
             useridfrom (int): The user ID of the sender.
 
-        Raises:
-            Exception: If the notification fails to send.
+        A failure in one provider is logged and does not prevent delivery
+        to the others.
         """
-        try:
-            # If State is set to 1, send notifications
-            if self.pushbullet_state == 1:
-                logging.info("Sending notification to Pushbullet")
-                pb = Pushbullet(self.pushbullet_key)
-                pb.send_notification(subject, summary)
-
-            if self.webhook_state == 1:
-                logging.info("Sending notification to Discord")
-                if useridfrom is not None:
-                    useridfrom_info = self.moodle_handler.user_id_from(
-                        useridfrom
-                    )
-                    fullname = useridfrom_info["fullname"]
-                    profile_url = useridfrom_info["profileimageurl"]
-                else:
-                    useridfrom_info = "69"
-                    fullname = "EvickaStudio"
-                    profile_url = (
-                        "https://avatars.githubusercontent.com/u/68477970"
-                    )
-
-                # print(data) # debug
-                self.webhook_discord(
-                    subject=subject,
-                    text=text,
-                    summary=summary,
-                    fullname=fullname,
-                    picture_url=profile_url,
-                )
-
-            else:
-                logging.info("No notification service selected")
+        if not self.senders:
+            logging.info("No notification service selected")
+            return
 
-        except Exception as e:
-            logging.exception("Failed to send notification")
-            raise e
+        # Providers are independent, so they are dispatched concurrently and
+        # the total latency is the slowest provider rather than the sum.
+        futures = []
+        for name, sender in self.senders:
+            logging.info("Sending notification to %s", name)
+            futures.append(
+                self.executor.submit(sender, subject, text, summary, useridfrom)
+            )
+
+        for (name, _), future in zip(self.senders, futures):
+            try:
+                future.result()
+            except Exception:
+                logging.exception("Failed to send notification to %s", name)
+
+    def _send_pushbullet(
+        self,
+        subject: str,
+        text: str,
+        summary: str,
+        useridfrom: Optional[int] = None,
+    ) -> None:
+        self.pushbullet.send_notification(subject, summary)
+
+    def _send_discord(
+        self,
+        subject: str,
+        text: str,
+        summary: str,
+        useridfrom: Optional[int] = None,
+    ) -> None:
+        if useridfrom is not None:
+            useridfrom_info = self.moodle_handler.user_id_from(useridfrom)
+            fullname = useridfrom_info["fullname"]
+            profile_url = useridfrom_info["profileimageurl"]
+        else:
+            fullname = "EvickaStudio"
+            profile_url = "https://avatars.githubusercontent.com/u/68477970"
+
+        self.webhook_discord(
+            subject=subject,
+            text=text,
+            summary=summary,
+            fullname=fullname,
+            picture_url=profile_url,
+        )
 
     @handle_exceptions
     def send_simple(self, subject: str, text: str) -> None:
@@ -1,8 +1,11 @@
 import logging
+from typing import Optional
 
 from src.gpt import GPT
 from src.utils import Config, handle_exceptions
 
+logger = logging.getLogger(__name__)
+
 
 class NotificationSummarizer:
     """
@@ -20,12 +23,30 @@ class NotificationSummarizer:
     def __init__(self, config: Config) -> None:
         self.api_key = config.get_config("summary", "OPENAI_API_KEY")
         self.system_message = config.get_config("summary", "SYSTEM_PROMPT")
-        self.model = config.get_config("summary", "MODEL")
-        # print(f"Model = {self.model}")  # Debug line
-        self.test = False
+        self.model = (
+            config.get_config("summary", "MODEL") or "gpt-3.5-turbo-1106"
+        )
+        self._ai: Optional[GPT] = None
+
+    def _get_ai(self) -> GPT:
+        """
+        Returns the GPT client, creating it on first use.
+        """
+        if self._ai is None:
+            ai = GPT()
+            ai.api_key = self.api_key
+            self._ai = ai
+        return self._ai
+
+    def _summarize_chat(self, text: str) -> str:
+        if self.system_message is None:
+            raise ValueError("System message must not be None")
+        return self._get_ai().chat_completion(
+            self.model, self.system_message, text
+        )
 
     @handle_exceptions
-    def summarize(self, text: str, use_assistant_api: bool = False) -> str:
+    def summarize(self, text: str) -> str:
         # sourcery skip: remove-pass-body
         """
         Summarizes the given text using GPT-3 API or FGPT.
@@ -33,7 +54,6 @@ class NotificationSummarizer:
         Args:
             text (str): The text to summarize.
             configModel (str): The GPT-3 model to use, or 'FGPT' to use FGPT.
-            use_assistant_api (bool, optional): Whether to use the chat completion or assistant API. Defaults to False.
 
         Returns:
             str: The summarized text.
@@ -42,32 +62,7 @@ class NotificationSummarizer:
             Exception: If summarization fails.
         """
         try:
-            # Test option, summarize the text using assistant and not the
-            # chat completion API, for testing ATM.
-
-            if self.test:
-                ############################################################
-                # # Test with cognitivecomputations/dolphin-2.6-mixtral-8x7b
-                # ai = GPTDeepinfra(api_key=self.api_key)
-                # return ai.chat_completion(self.system_message, text or ""
-                ############################################################
-                return ""  # Added return statement
-
-            else:
-                if self.model is None or self.model == "":
-                    self.model = "gpt-3.5-turbo-1106"
-                ai = GPT()
-                ai.api_key = self.api_key
-                if not use_assistant_api:
-                    if self.model is None or self.system_message is None:
-                        raise ValueError(
-                            "Model and system message must not be None"
-                        )
-                    return ai.chat_completion(
-                        self.model, self.system_message, text or ""
-                    )
-
-                return ai.context_assistant(prompt=text)
-        except Exception as e:
-            logging.exception(f"Failed to summarize with {self.model}")
-            raise e
+            return self._summarize_chat(text or "")
+        except Exception:
+            logger.exception("Failed to summarize with %s", self.model)
+            raise
@@ -1,4 +1,5 @@
 from ..utils.handle_exceptions import handle_exceptions
+from ..utils.http_session import REQUEST_TIMEOUT, session
 from ..utils.load_config import Config
 
-__all__ = ["Config", "handle_exceptions"]
+__all__ = ["Config", "REQUEST_TIMEOUT", "handle_exceptions", "session"]
@@ -0,0 +1,55 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Number of hosts to keep connection pools for, and connections per host
+POOL_CONNECTIONS = 16
+POOL_MAXSIZE = 16
+
+# Timeout (seconds) for requests to the notification services, so a hanging
+# service cannot stall the poll loop
+REQUEST_TIMEOUT = 10
+
+# Longest Retry-After delay (seconds) honoured before a retry
+MAX_RETRY_AFTER = 10
+
+
+class _CappedRetry(Retry):
+    """
+    Retry that caps the server's Retry-After delay at MAX_RETRY_AFTER.
+    """
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, MAX_RETRY_AFTER)
+
+
+# Retry transient failures of the notification services: failed connections,
+# rate limiting and unavailable services, all of which mean the notification
+# was not delivered. Read errors and 502/504 responses are not retried,
+# because the service or the gateway in front of it may already have
+# accepted the notification and a retry would post it twice.
+RETRY = _CappedRetry(
+    total=3,
+    connect=3,
+    read=0,
+    backoff_factor=0.3,
+    status_forcelist=(429, 503),
+    allowed_methods=frozenset({"POST"}),
+    raise_on_status=False,
+)
+
+# HTTP session shared by the notification modules. Using a single session
+# keeps connections to the notification services alive between
+# notifications instead of opening (and TLS-handshaking) a new connection
+# for every request.
+session = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=POOL_CONNECTIONS,
+    pool_maxsize=POOL_MAXSIZE,
+    max_retries=RETRY,
+)
+session.mount("http://", _adapter)
+session.mount("https://", _adapter)